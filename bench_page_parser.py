@@ -0,0 +1,94 @@
+import json
+import re
+import time
+
+from page_parser import parse_chains_page, parse_text_chains
+
+
+LEGACY_PATTERN = r"(\w+).*?(\d+).*?\$([0-9,]+\.?\d*[BMK]?)"
+BACKTRACKING_UNIT = "<div>chain12 tvl</div>"
+LINEARITY_TOLERANCE = 3
+
+
+def build_page(rows, with_next_data=False):
+    filler = "<div class=\"sc-1 sc-2\"><span>Lorem ipsum dolor</span></div>" * 20
+    body = "".join(
+        f"<div><a>Chain{i}</a><span>{i % 900}</span><span>${i},{i % 1000:03d}.5M</span></div>"
+        f"{filler}"
+        for i in range(rows)
+    )
+    next_data = ""
+    if with_next_data:
+        payload = {"props": {"pageProps": {"chains": [
+            {"name": f"Chain{i}", "protocols": i % 900, "tvl": i * 1_000_000.0}
+            for i in range(rows)
+        ]}}}
+        next_data = (
+            '<script id="__NEXT_DATA__" type="application/json">'
+            f"{json.dumps(payload)}</script>"
+        )
+    return f"<html><body>{body}{next_data}</body></html>"
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, len(result)
+
+
+def check_linear(label, samples):
+    per_mb = [seconds / size_mb for size_mb, seconds in samples]
+    ratio = max(per_mb) / min(per_mb)
+    print(f"{label}: {min(per_mb):.4f}-{max(per_mb):.4f} s/MB (spread {ratio:.1f}x)")
+    assert ratio < LINEARITY_TOLERANCE, f"{label} does not scale linearly"
+
+
+def main():
+    print(f"{'rows':>6} {'size MB':>8} {'text s':>8} {'text s/MB':>10} {'next_data s/MB':>15}")
+    text_samples = []
+    next_samples = []
+    for rows in (500, 1000, 2000, 4000):
+        page = build_page(rows)
+        next_page = build_page(rows, True)
+        text_time, text_count = time_call(parse_text_chains, page)
+        next_time, next_count = time_call(parse_chains_page, next_page)
+        assert text_count == rows and next_count == rows
+        size_mb = len(page) / 1_000_000
+        next_size_mb = len(next_page) / 1_000_000
+        text_samples.append((size_mb, text_time))
+        next_samples.append((next_size_mb, next_time))
+        print(
+            f"{rows:>6} {size_mb:>8.2f} {text_time:>8.4f} "
+            f"{text_time / size_mb:>10.4f} {next_time / next_size_mb:>15.4f}"
+        )
+
+    print()
+    print("Single-line page without '$' (backtracking input for the legacy pattern):")
+    print(f"{'size KB':>8} {'legacy s':>9} {'text s':>8}")
+    for units in (12, 25, 50):
+        page = BACKTRACKING_UNIT * units
+        legacy_time, _ = time_call(re.findall, LEGACY_PATTERN, page)
+        text_time, _ = time_call(parse_text_chains, page)
+        print(f"{len(page) / 1_000:>8.1f} {legacy_time:>9.4f} {text_time:>8.4f}")
+
+    backtracking_samples = []
+    for units in (25_000, 50_000, 100_000, 200_000):
+        page = BACKTRACKING_UNIT * units
+        text_time, _ = time_call(parse_text_chains, page)
+        backtracking_samples.append((len(page) / 1_000_000, text_time))
+
+    unclosed_samples = []
+    for count in (250_000, 500_000, 1_000_000, 2_000_000):
+        page = "<a" * count
+        text_time, _ = time_call(parse_text_chains, page)
+        unclosed_samples.append((len(page) / 1_000_000, text_time))
+
+    print()
+    check_linear("text parser, table page", text_samples)
+    check_linear("__NEXT_DATA__ parser", next_samples)
+    check_linear("text parser, backtracking input", backtracking_samples)
+    check_linear("text parser, unclosed '<'", unclosed_samples)
+
+
+if __name__ == "__main__":
+    main()
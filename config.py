@@ -1,15 +1,174 @@
 import json
 import os
 import logging
+from dataclasses import dataclass
+
+
+SUPPORTED_PROXY_TYPES = ("http", "https", "socks5", "socks4")
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+class ConfigError(ValueError):
+    pass
+
+
+def format_proxy_url(proxy_config):
+    if not isinstance(proxy_config, dict):
+        raise ConfigError(f"Proxy entry must be an object, got: {proxy_config!r}")
+
+    proxy_type = str(proxy_config.get("type", "http")).lower()
+    host = proxy_config.get("host", "")
+    port = proxy_config.get("port", 8080)
+    username = proxy_config.get("username", "")
+    password = proxy_config.get("password", "")
+
+    if proxy_type not in SUPPORTED_PROXY_TYPES:
+        raise ConfigError(f"Unsupported proxy type: {proxy_type}")
+    if not host:
+        raise ConfigError("Proxy host must not be empty")
+    if isinstance(port, str) and port.strip().isdigit():
+        port = int(port)
+    if isinstance(port, bool) or not isinstance(port, int) or not 0 < port < 65536:
+        raise ConfigError(f"Invalid proxy port: {port!r}")
+
+    if username and password:
+        return f"{proxy_type}://{username}:{password}@{host}:{port}"
+    return f"{proxy_type}://{host}:{port}"
+
+
+def _require(config, key, expected_type, minimum=None):
+    value = config.get(key)
+    if isinstance(value, bool) and expected_type is not bool:
+        raise ConfigError(f"'{key}' must be {expected_type.__name__}, got: {value!r}")
+    if expected_type is float and isinstance(value, int):
+        value = float(value)
+    if not isinstance(value, expected_type):
+        raise ConfigError(f"'{key}' must be {expected_type.__name__}, got: {value!r}")
+    if minimum is not None and value < minimum:
+        raise ConfigError(f"'{key}' must be >= {minimum}, got: {value!r}")
+    return value
+
+
+@dataclass(frozen=True)
+class ProxyConfig:
+    enabled: bool
+    rotate_proxies: bool
+    rotation_interval: int
+    urls: tuple
+
+    @classmethod
+    def from_dict(cls, proxy_config):
+        if not isinstance(proxy_config, dict):
+            raise ConfigError("'proxy' must be an object")
+
+        enabled = _require(proxy_config, "enabled", bool)
+        rotate_proxies = _require(proxy_config, "rotate_proxies", bool)
+        rotation_interval = _require(proxy_config, "rotation_interval", int, minimum=1)
+
+        urls = ()
+        if enabled:
+            proxy_list = proxy_config.get("proxy_list", [])
+            if rotate_proxies and isinstance(proxy_list, list) and proxy_list:
+                urls = tuple(format_proxy_url(proxy) for proxy in proxy_list)
+            else:
+                if rotate_proxies:
+                    logging.getLogger(__name__).warning(
+                        "Proxy rotation is enabled, but 'proxy_list' is missing or invalid."
+                    )
+                    rotate_proxies = False
+                if proxy_config.get("host"):
+                    urls = (format_proxy_url(proxy_config),)
+
+        return cls(
+            enabled=enabled,
+            rotate_proxies=rotate_proxies,
+            rotation_interval=rotation_interval,
+            urls=urls
+        )
+
+
+@dataclass(frozen=True)
+class SupervisorConfig:
+    max_cycles_per_worker: int
+    max_worker_rss_mb: int
+    cycle_timeout_minutes: int
+    trace_allocations: bool
+    top_allocation_diffs: int
+
+    @classmethod
+    def from_dict(cls, supervisor_config):
+        if not isinstance(supervisor_config, dict):
+            raise ConfigError("'supervisor' must be an object")
+
+        return cls(
+            max_cycles_per_worker=_require(
+                supervisor_config, "max_cycles_per_worker", int, minimum=1
+            ),
+            max_worker_rss_mb=_require(supervisor_config, "max_worker_rss_mb", int, minimum=0),
+            cycle_timeout_minutes=_require(
+                supervisor_config, "cycle_timeout_minutes", int, minimum=1
+            ),
+            trace_allocations=_require(supervisor_config, "trace_allocations", bool),
+            top_allocation_diffs=_require(
+                supervisor_config, "top_allocation_diffs", int, minimum=0
+            )
+        )
+
+
+@dataclass(frozen=True)
+class ScraperConfig:
+    scrape_interval_minutes: int
+    output_filename: str
+    log_filename: str
+    max_retries: int
+    retry_delay_seconds: float
+    enable_logging: bool
+    log_level: str
+    save_historical_data: bool
+    historical_data_dir: str
+    include_zero_tvl: bool
+    config_reload_seconds: int
+    proxy: ProxyConfig
+    supervisor: SupervisorConfig
+
+    @classmethod
+    def from_dict(cls, config):
+        log_level = _require(config, "log_level", str).upper()
+        if log_level not in LOG_LEVELS:
+            raise ConfigError(f"Unsupported log level: {log_level}")
+
+        return cls(
+            scrape_interval_minutes=_require(config, "scrape_interval_minutes", int, minimum=1),
+            output_filename=_require(config, "output_filename", str),
+            log_filename=_require(config, "log_filename", str),
+            max_retries=_require(config, "max_retries", int, minimum=1),
+            retry_delay_seconds=_require(config, "retry_delay_seconds", float, minimum=0),
+            enable_logging=_require(config, "enable_logging", bool),
+            log_level=log_level,
+            save_historical_data=_require(config, "save_historical_data", bool),
+            historical_data_dir=_require(config, "historical_data_dir", str),
+            include_zero_tvl=_require(config, "include_zero_tvl", bool),
+            config_reload_seconds=_require(config, "config_reload_seconds", int, minimum=0),
+            proxy=ProxyConfig.from_dict(config.get("proxy")),
+            supervisor=SupervisorConfig.from_dict(config.get("supervisor"))
+        )
 
 
 class ConfigManager:
-    def __init__(self, config_file="config.json"):
+    def __init__(self, config_file="config.json", config=None):
         self.config_file = config_file
-        self.config = self.load_config()
+        self.logger = logging.getLogger(__name__)
+        self._file_state = None
+        self._failed_file_state = None
+        if config is None:
+            self.config = self.load_config()
+        else:
+            self._file_state = self._current_file_state()
+            self.config = config
 
-    def load_config(self):
-        default_config = {
+    @staticmethod
+    def default_config():
+        return {
             "scrape_interval_minutes": 5,
             "output_filename": "defillama_chains.csv",
             "log_filename": "defillama_scraper.log",
@@ -20,6 +179,7 @@ class ConfigManager:
             "save_historical_data": False,
             "historical_data_dir": "historical_data",
             "include_zero_tvl": True,
+            "config_reload_seconds": 5,
             "proxy": {
                 "enabled": False,
                 "type": "http",
@@ -30,39 +190,100 @@ class ConfigManager:
                 "rotate_proxies": False,
                 "proxy_list": [],
                 "rotation_interval": 10
+            },
+            "supervisor": {
+                "max_cycles_per_worker": 12,
+                "max_worker_rss_mb": 512,
+                "cycle_timeout_minutes": 30,
+                "trace_allocations": False,
+                "top_allocation_diffs": 5
             }
         }
 
+    def _read_config(self):
+        default_config = self.default_config()
+        with open(self.config_file, "r") as f:
+            try:
+                loaded_config = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ConfigError(f"Invalid JSON in {self.config_file}: {e}") from e
+        if not isinstance(loaded_config, dict):
+            raise ConfigError("Configuration root must be an object")
+
+        for section in ("proxy", "supervisor"):
+            section_config = loaded_config.pop(section, None)
+            if isinstance(section_config, dict):
+                default_config[section].update(section_config)
+            elif section_config is not None:
+                default_config[section] = section_config
+        default_config.update(loaded_config)
+
+        return ScraperConfig.from_dict(default_config)
+
+    def _current_file_state(self):
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, "r") as f:
-                    loaded_config = json.load(f)
-                default_config.update(loaded_config)
-                print(f"Configuration loaded from {self.config_file}")
-            else:
-                with open(self.config_file, "w") as f:
-                    json.dump(default_config, f, indent=4)
-                print(f"Default configuration created: {self.config_file}")
+            stat = os.stat(self.config_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
-            return default_config
+    def load_config(self):
+        if os.path.exists(self.config_file):
+            file_state = self._current_file_state()
+            config = self._read_config()
+            self._file_state = file_state
+            print(f"Configuration loaded from {self.config_file}")
+            return config
 
-        except Exception as e:
-            print(f"Error loading config: {e}")
+        default_config = self.default_config()
+        try:
+            with open(self.config_file, "w") as f:
+                json.dump(default_config, f, indent=4)
+            self._file_state = self._current_file_state()
+            print(f"Default configuration created: {self.config_file}")
+        except OSError as e:
+            print(f"Error creating default config: {e}")
             print("Using default configuration")
-            return default_config
+
+        return ScraperConfig.from_dict(default_config)
+
+    def reload_if_changed(self):
+        file_state = self._current_file_state()
+        if file_state is None or file_state == self._file_state:
+            return None
+
+        try:
+            config = self._read_config()
+        except Exception as e:
+            if file_state != self._failed_file_state:
+                self.logger.error(
+                    f"Ignoring invalid configuration in {self.config_file}: {e}"
+                )
+            self._failed_file_state = file_state
+            return None
+
+        self._file_state = file_state
+        self._failed_file_state = None
+
+        if config == self.config:
+            return None
+
+        self.config = config
+        self.logger.info(f"Configuration reloaded from {self.config_file}")
+        return config
 
     def setup_logging(self):
-        if not self.config["enable_logging"]:
+        if not self.config.enable_logging:
             logging.disable(logging.CRITICAL)
             return
 
-        log_level = getattr(logging, self.config["log_level"].upper(), logging.INFO)
+        log_level = getattr(logging, self.config.log_level, logging.INFO)
 
         logging.basicConfig(
             level=log_level,
             format="%(asctime)s - %(levelname)s - %(message)s",
             handlers=[
-                logging.FileHandler(self.config["log_filename"]),
+                logging.FileHandler(self.config.log_filename),
                 logging.StreamHandler()
             ]
         )
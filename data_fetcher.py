@@ -1,5 +1,4 @@
 import time
-import re
 import logging
 import urllib.parse
 from collections import defaultdict
@@ -11,6 +10,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as ec
 
+from page_parser import extract_number, extract_tvl, parse_chains_page
+
 
 class DataFetcher:
     def __init__(self, config, proxy_manager):
@@ -46,7 +47,7 @@ class DataFetcher:
             self.logger.info(f"Counted protocols for {len(protocol_counts)} chains")
 
             csv_data = []
-            include_zero_tvl = self.config.get("include_zero_tvl", True)
+            include_zero_tvl = self.config.include_zero_tvl
 
             for chain in chains_data:
                 name = chain.get("name", "Unknown")
@@ -118,7 +119,7 @@ class DataFetcher:
             time.sleep(5)
 
             chains_data = []
-            include_zero_tvl = self.config.get("include_zero_tvl", True)
+            include_zero_tvl = self.config.include_zero_tvl
 
             try:
                 rows = driver.find_elements(By.TAG_NAME, "tr")
@@ -134,8 +135,8 @@ class DataFetcher:
 
                             if name and (include_zero_tvl or (
                                     "$" in tvl_text and not tvl_text.strip() in ["$0", "$0.00", "-"])):
-                                protocols = self._extract_number(protocols_text)
-                                tvl = self._extract_tvl(tvl_text) if "$" in tvl_text else 0
+                                protocols = extract_number(protocols_text)
+                                tvl = extract_tvl(tvl_text) if "$" in tvl_text else 0
 
                                 chains_data.append({
                                     "name": name,
@@ -150,59 +151,19 @@ class DataFetcher:
                 self.logger.error(f"Table extraction failed: {e}")
 
             if not chains_data:
-                self.logger.info("No table found, trying div extraction...")
-                page_text = driver.page_source
-
-                chain_pattern = r"(\w+).*?(\d+).*?\$([0-9,]+\.?\d*[BMK]?)"
-                matches = re.findall(chain_pattern, page_text)
-
-                for match in matches:
-                    if len(match) == 3:
-                        name, protocols, tvl_text = match
-                        tvl = self._extract_tvl(f"${tvl_text}")
-
-                        if include_zero_tvl or tvl > 0:
-                            chains_data.append({
-                                "name": name,
-                                "protocols": int(protocols) if protocols.isdigit() else 0,
-                                "tvl": tvl,
-                                "timestamp": datetime.now().isoformat()
-                            })
+                self.logger.info("No table found, parsing page source...")
+                matches = parse_chains_page(driver.page_source)
+
+                for name, protocols, tvl in matches:
+                    if include_zero_tvl or tvl > 0:
+                        chains_data.append({
+                            "name": name,
+                            "protocols": protocols,
+                            "tvl": tvl,
+                            "timestamp": datetime.now().isoformat()
+                        })
 
             return chains_data
 
         finally:
             driver.quit()
-
-    def _extract_number(self, text):
-        if not text:
-            return 0
-        numbers = re.findall(r"\d+", text.replace(",", ""))
-        if numbers:
-            try:
-                return int(numbers[0])
-            except:
-                return 0
-        return 0
-
-    def _extract_tvl(self, text):
-        if not text:
-            return 0
-
-        clean_text = re.sub(r"[$,]", "", text).strip()
-
-        multiplier = 1
-        if clean_text.endswith("B") or clean_text.endswith("b"):
-            multiplier = 1_000_000_000
-            clean_text = clean_text[:-1]
-        elif clean_text.endswith("M") or clean_text.endswith("m"):
-            multiplier = 1_000_000
-            clean_text = clean_text[:-1]
-        elif clean_text.endswith("K") or clean_text.endswith("k"):
-            multiplier = 1_000
-            clean_text = clean_text[:-1]
-
-        try:
-            return float(clean_text) * multiplier
-        except:
-            return 0
@@ -17,7 +17,7 @@ class DataSaver:
             return False
 
         if filename is None:
-            filename = self.config["output_filename"]
+            filename = self.config.output_filename
 
         try:
             chains_data.sort(key=lambda x: (x["tvl"] == 0, -x["tvl"]))
@@ -42,11 +42,11 @@ class DataSaver:
             return False
 
     def save_historical_data(self, chains_data):
-        if not self.config.get("save_historical_data", False):
+        if not self.config.save_historical_data:
             return
 
         try:
-            hist_dir = Path(self.config["historical_data_dir"])
+            hist_dir = Path(self.config.historical_data_dir)
             hist_dir.mkdir(exist_ok=True)
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -87,7 +87,7 @@ class DataSaver:
             return False
 
         if filename is None:
-            filename = self.config["output_filename"].replace(".csv", ".json")
+            filename = self.config.output_filename.replace(".csv", ".json")
 
         try:
             with open(filename, "w", encoding="utf-8") as jsonfile:
@@ -106,7 +106,7 @@ class DataSaver:
             return False
 
         if filename is None:
-            filename = self.config["output_filename"].replace(".csv", ".xlsx")
+            filename = self.config.output_filename.replace(".csv", ".xlsx")
 
         try:
             df = pd.DataFrame(chains_data)
@@ -11,6 +11,7 @@ def display_menu():
     print("5. Export data (Excel)")
     print("6. Show configuration")
     print("7. Exit")
+    print("8. Start supervised scheduler")
     print("-" * 50)
 
 
@@ -32,7 +33,7 @@ def main():
 
     while True:
         display_menu()
-        choice = input("Enter your choice (1-7): ").strip()
+        choice = input("Enter your choice (1-8): ").strip()
 
         if choice == "1":
             print("\nRunning scraper once...")
@@ -81,10 +82,14 @@ def main():
             print("Exiting... Goodbye!")
             break
 
+        elif choice == "8":
+            print("\nStarting supervised scheduler...")
+            scraper.start_scheduler(supervised=True)
+
         else:
-            print("Invalid choice. Please enter a number between 1-7.")
+            print("Invalid choice. Please enter a number between 1-8.")
 
-        if choice != "2":
+        if choice not in ("2", "8"):
             input("\nPress Enter to continue...")
 
 
@@ -0,0 +1,137 @@
+import json
+import re
+
+
+NUMBER_PATTERN = re.compile(r"\d+")
+TVL_CLEAN_PATTERN = re.compile(r"[$,\s]")
+TVL_PATTERN = re.compile(r"^(\d+\.?\d*|\.\d+)([BMKbmk]?)$")
+
+TAG_PATTERN = re.compile(r"<[^<>]*>")
+NAME_TOKEN_PATTERN = re.compile(r"^[A-Za-z][\w .()'-]{0,63}$")
+PROTOCOLS_TOKEN_PATTERN = re.compile(r"^\d{1,3}(?:,\d{3})*$|^\d+$")
+TVL_TOKEN_PATTERN = re.compile(r"^\$(?:\d[\d,]*\.?\d*|\.\d+)[BMKbmk]?$")
+
+NEXT_DATA_MARKER = 'id="__NEXT_DATA__"'
+
+TVL_MULTIPLIERS = {
+    "": 1,
+    "k": 1_000,
+    "m": 1_000_000,
+    "b": 1_000_000_000,
+}
+
+
+def extract_number(text):
+    if not text:
+        return 0
+    match = NUMBER_PATTERN.search(text.replace(",", ""))
+    return int(match.group()) if match else 0
+
+
+def extract_tvl(text):
+    if not text:
+        return 0
+    match = TVL_PATTERN.match(TVL_CLEAN_PATTERN.sub("", text))
+    if not match:
+        return 0
+    value, suffix = match.groups()
+    return float(value) * TVL_MULTIPLIERS[suffix.lower()]
+
+
+def extract_next_data(html):
+    marker = html.find(NEXT_DATA_MARKER)
+    if marker == -1:
+        return None
+
+    start = html.find(">", marker)
+    if start == -1:
+        return None
+    end = html.find("</script>", start)
+    if end == -1:
+        return None
+
+    try:
+        return json.loads(html[start + 1:end])
+    except ValueError:
+        return None
+
+
+def _protocols_value(value):
+    if isinstance(value, list):
+        return len(value)
+    if isinstance(value, bool):
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        return extract_number(value)
+    return 0
+
+
+def _tvl_value(value):
+    if isinstance(value, bool):
+        return 0
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return extract_tvl(value)
+    return 0
+
+
+def _is_chain_row(item):
+    return isinstance(item, dict) and isinstance(item.get("name"), str) and "tvl" in item
+
+
+def parse_next_data_chains(payload):
+    best = []
+    stack = [payload]
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            rows = [item for item in node if _is_chain_row(item)]
+            if len(rows) > len(best):
+                best = rows
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+
+    return [
+        (row["name"], _protocols_value(row.get("protocols")), _tvl_value(row.get("tvl")))
+        for row in best
+    ]
+
+
+def parse_text_chains(html):
+    tokens = [
+        token.strip()
+        for token in TAG_PATTERN.sub("\n", html).splitlines()
+    ]
+    tokens = [token for token in tokens if token]
+
+    chains = []
+    i = 0
+    while i + 2 < len(tokens):
+        name, protocols_text, tvl_text = tokens[i:i + 3]
+        if (NAME_TOKEN_PATTERN.match(name)
+                and PROTOCOLS_TOKEN_PATTERN.match(protocols_text)
+                and TVL_TOKEN_PATTERN.match(tvl_text)):
+            chains.append((name, extract_number(protocols_text), extract_tvl(tvl_text)))
+            i += 3
+        else:
+            i += 1
+
+    return chains
+
+
+def parse_chains_page(html):
+    if not html:
+        return []
+
+    payload = extract_next_data(html)
+    if payload is not None:
+        chains = parse_next_data_chains(payload)
+        if chains:
+            return chains
+
+    return parse_text_chains(html)
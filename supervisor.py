@@ -0,0 +1,287 @@
+import gc
+import logging
+import multiprocessing
+import signal
+import time
+import tracemalloc
+
+import psutil
+
+
+MB = 1024 * 1024
+
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "*/fnmatch.py"),
+    tracemalloc.Filter(False, "*/re/*"),
+    tracemalloc.Filter(False, "*/sre_*.py"),
+    tracemalloc.Filter(False, "*/multiprocessing/*"),
+    tracemalloc.Filter(False, "*/psutil/*"),
+    tracemalloc.Filter(False, "<frozen abc>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def reap_processes(processes, timeout=5):
+    for process in processes:
+        try:
+            process.terminate()
+        except psutil.NoSuchProcess:
+            pass
+
+    _, alive = psutil.wait_procs(processes, timeout=timeout)
+    for process in alive:
+        try:
+            process.kill()
+        except psutil.NoSuchProcess:
+            pass
+
+
+def reap_child_processes(logger):
+    children = psutil.Process().children(recursive=True)
+    if children:
+        names = ", ".join(sorted({_process_name(child) for child in children}))
+        logger.warning(f"Reaping {len(children)} leftover child processes: {names}")
+        reap_processes(children)
+
+
+def _process_name(process):
+    try:
+        return process.name()
+    except psutil.Error:
+        return str(process.pid)
+
+
+def _take_snapshot():
+    return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+
+def run_worker(config_file, config, connection):
+    from web_scraper import DeFiLlamaScraper
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    scraper = DeFiLlamaScraper(config_file, config)
+    logger = logging.getLogger(__name__)
+    process = psutil.Process()
+    previous_snapshot = None
+
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            break
+        command = message[0]
+
+        if command == "stop":
+            break
+        if command == "config":
+            scraper.apply_config(message[1])
+            continue
+
+        supervisor_config = scraper.config.supervisor
+        if supervisor_config.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _take_snapshot()
+        elif not supervisor_config.trace_allocations and tracemalloc.is_tracing():
+            tracemalloc.stop()
+            previous_snapshot = None
+
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+        chains_data = scraper.run_once()
+        chains = len(chains_data) if chains_data else 0
+        del chains_data
+        gc.collect()
+        reap_child_processes(logger)
+
+        report = {
+            "chains": chains,
+            "rss": process.memory_info().rss,
+            "traced_current": None,
+            "traced_peak": None,
+            "allocation_diffs": []
+        }
+
+        if tracemalloc.is_tracing():
+            report["traced_current"], report["traced_peak"] = tracemalloc.get_traced_memory()
+            snapshot = _take_snapshot()
+            if previous_snapshot is not None:
+                diffs = [
+                    diff for diff in snapshot.compare_to(previous_snapshot, "lineno")
+                    if diff.size_diff
+                ]
+                report["allocation_diffs"] = [
+                    str(diff) for diff in diffs[:supervisor_config.top_allocation_diffs]
+                ]
+            previous_snapshot = snapshot
+
+        connection.send(report)
+
+    connection.close()
+
+
+class ScrapeSupervisor:
+    def __init__(self, config_file, config):
+        self.config_file = config_file
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.context = multiprocessing.get_context("spawn")
+        self.worker = None
+        self.connection = None
+        self.worker_cycles = 0
+        self.total_cycles = 0
+
+    def update_config(self, config):
+        self.config = config
+        if self.worker is not None:
+            self._send(("config", config))
+
+    def start_worker(self):
+        parent_connection, child_connection = self.context.Pipe()
+        self.worker = self.context.Process(
+            target=run_worker,
+            args=(self.config_file, self.config, child_connection),
+            name="scrape-worker",
+            daemon=True
+        )
+        self.worker.start()
+        child_connection.close()
+
+        self.connection = parent_connection
+        self.worker_cycles = 0
+        self.logger.info(f"Started scrape worker process (pid {self.worker.pid})")
+
+    def stop_worker(self, timeout=30):
+        if self.worker is None:
+            return
+
+        descendants = self._worker_descendants()
+        self._send(("stop",))
+        self.worker.join(timeout)
+        if self.worker.is_alive():
+            self.logger.warning(f"Worker {self.worker.pid} did not exit, terminating")
+            self.worker.terminate()
+            self.worker.join()
+
+        self._reap_orphans(descendants)
+        self.connection.close()
+        self.logger.info(
+            f"Stopped scrape worker process (pid {self.worker.pid}) "
+            f"after {self.worker_cycles} cycles"
+        )
+        self.worker = None
+        self.connection = None
+
+    def run_cycle(self):
+        if self.worker is None:
+            self.start_worker()
+
+        if not self._send(("run",)):
+            self._discard_dead_worker([])
+            return
+
+        report = self._wait_for_report()
+        if report is None:
+            return
+
+        self.worker_cycles += 1
+        self.total_cycles += 1
+        self._log_report(report)
+
+        recycle_reason = self._recycle_reason(report["rss"])
+        if recycle_reason:
+            self.logger.info(f"Recycling scrape worker: {recycle_reason}")
+            self.stop_worker()
+
+    def _wait_for_report(self):
+        timeout_minutes = self.config.supervisor.cycle_timeout_minutes
+        deadline = time.monotonic() + timeout_minutes * 60
+        descendants = []
+        while not self.connection.poll(1):
+            if not self.worker.is_alive():
+                self._discard_dead_worker(descendants)
+                return None
+            descendants = self._worker_descendants() or descendants
+            if time.monotonic() >= deadline:
+                self.logger.error(
+                    f"Scrape worker process (pid {self.worker.pid}) exceeded the "
+                    f"{timeout_minutes} minute cycle timeout, terminating"
+                )
+                self.worker.terminate()
+                self._discard_dead_worker(descendants, terminated=True)
+                return None
+
+        try:
+            return self.connection.recv()
+        except (EOFError, OSError):
+            self._discard_dead_worker(descendants)
+            return None
+
+    def _discard_dead_worker(self, descendants, terminated=False):
+        self.worker.join(5)
+        if terminated:
+            self.logger.info(f"Terminated scrape worker process (pid {self.worker.pid})")
+        else:
+            self.logger.error(
+                f"Scrape worker process (pid {self.worker.pid}) died "
+                f"with exit code {self.worker.exitcode}"
+            )
+        self._reap_orphans(descendants)
+        self.connection.close()
+        self.worker = None
+        self.connection = None
+
+    def _recycle_reason(self, rss):
+        supervisor_config = self.config.supervisor
+        if self.worker_cycles >= supervisor_config.max_cycles_per_worker:
+            return f"reached {self.worker_cycles} cycles"
+        if supervisor_config.max_worker_rss_mb and rss > supervisor_config.max_worker_rss_mb * MB:
+            return (
+                f"RSS {rss / MB:.1f} MB exceeds "
+                f"{supervisor_config.max_worker_rss_mb} MB limit"
+            )
+        return None
+
+    def _log_report(self, report):
+        status = f"{report['chains']} chains" if report["chains"] else "failed"
+        message = (
+            f"Cycle {self.total_cycles} (worker cycle {self.worker_cycles}): {status}, "
+            f"worker RSS {report['rss'] / MB:.1f} MB"
+        )
+        if report["traced_peak"] is not None:
+            message += (
+                f", allocation peak {report['traced_peak'] / MB:.1f} MB, "
+                f"traced after cycle {report['traced_current'] / MB:.1f} MB"
+            )
+        self.logger.info(message)
+
+        if report["allocation_diffs"]:
+            self.logger.info("Largest allocation changes since previous cycle:")
+            for diff in report["allocation_diffs"]:
+                self.logger.info(f"  {diff}")
+
+    def _send(self, message):
+        try:
+            self.connection.send(message)
+            return True
+        except (OSError, EOFError, BrokenPipeError):
+            return False
+
+    def _worker_descendants(self):
+        try:
+            return psutil.Process(self.worker.pid).children(recursive=True)
+        except psutil.Error:
+            return []
+
+    def _reap_orphans(self, descendants):
+        leftovers = [process for process in descendants if process.is_running()]
+        if leftovers:
+            names = ", ".join(sorted({_process_name(process) for process in leftovers}))
+            self.logger.warning(
+                f"Reaping {len(leftovers)} orphaned worker processes: {names}"
+            )
+            reap_processes(leftovers)
@@ -0,0 +1,37 @@
+import pytest
+
+from page_parser import extract_number, extract_tvl
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("", 0),
+    (None, 0),
+    ("$0", 0),
+    ("$0.00", 0),
+    ("-", 0),
+    ("$1,234.56", 1234.56),
+    ("$12.5B", 12_500_000_000),
+    ("$3.2m", 3_200_000),
+    ("$450k", 450_000),
+    ("$.5M", 500_000),
+    ("$12.", 12),
+    ("$ 7M", 7_000_000),
+    ("1.5", 1.5),
+    ("$abc", 0),
+    ("$1.2.3M", 0),
+])
+def test_extract_tvl(text, expected):
+    assert extract_tvl(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("", 0),
+    (None, 0),
+    ("1,234", 1234),
+    ("12 protocols", 12),
+    ("abc", 0),
+    ("-", 0),
+    ("v2 12", 2),
+])
+def test_extract_number(text, expected):
+    assert extract_number(text) == expected
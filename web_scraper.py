@@ -5,11 +5,12 @@ from config import ConfigManager
 from proxy_manager import ProxyManager
 from data_fetcher import DataFetcher
 from data_saver import DataSaver
+from supervisor import ScrapeSupervisor
 
 
 class DeFiLlamaScraper:
-    def __init__(self, config_file="config.json"):
-        self.config_manager = ConfigManager(config_file)
+    def __init__(self, config_file="config.json", config=None):
+        self.config_manager = ConfigManager(config_file, config)
         self.config = self.config_manager.config
         self.logger = self.config_manager.setup_logging()
 
@@ -17,12 +18,39 @@ class DeFiLlamaScraper:
         self.data_fetcher = DataFetcher(self.config, self.proxy_manager)
         self.data_saver = DataSaver(self.config)
 
+        self.scheduled_job = None
+        self.scheduled_task = self.run_once
+        self.supervisor = None
+
         if self.logger:
             self.logger.info("DeFiLlama Scraper initialized")
 
+    def apply_config(self, config):
+        previous_interval = self.config.scrape_interval_minutes
+
+        self.config = config
+        self.proxy_manager.update_config(config)
+        self.data_fetcher.config = config
+        self.data_saver.config = config
+        if self.supervisor:
+            self.supervisor.update_config(config)
+
+        interval = config.scrape_interval_minutes
+        if self.scheduled_job and interval != previous_interval:
+            schedule.cancel_job(self.scheduled_job)
+            self.scheduled_job = schedule.every(interval).minutes.do(self.scheduled_task)
+            self.logger.info(f"Rescheduled scraper with {interval} minute intervals")
+
+        self.logger.info("New configuration applied")
+
+    def reload_config(self):
+        config = self.config_manager.reload_if_changed()
+        if config is not None:
+            self.apply_config(config)
+
     def scrape_data_with_retry(self):
-        max_retries = self.config.get("max_retries", 3)
-        retry_delay = self.config.get("retry_delay_seconds", 10)
+        max_retries = self.config.max_retries
+        retry_delay = self.config.retry_delay_seconds
 
         for attempt in range(max_retries):
             try:
@@ -62,22 +90,43 @@ class DeFiLlamaScraper:
         self.logger.info("Starting data scraping...")
         return self.scrape_data_with_retry()
 
-    def start_scheduler(self):
-        interval = self.config.get("scrape_interval_minutes", 5)
+    def start_scheduler(self, supervised=False):
+        interval = self.config.scrape_interval_minutes
 
-        self.logger.info(f"Starting scheduler with {interval} minute intervals")
+        if supervised:
+            self.supervisor = ScrapeSupervisor(self.config_manager.config_file, self.config)
+            self.scheduled_task = self.supervisor.run_cycle
+            self.logger.info(
+                f"Starting supervised scheduler with {interval} minute intervals"
+            )
+        else:
+            self.scheduled_task = self.run_once
+            self.logger.info(f"Starting scheduler with {interval} minute intervals")
         self.logger.info("Press Ctrl+C to stop the scheduler")
 
-        schedule.every(interval).minutes.do(self.run_once)
-
-        self.run_once()
+        self.scheduled_job = schedule.every(interval).minutes.do(self.scheduled_task)
 
         try:
+            self.scheduled_task()
+
+            last_config_check = time.monotonic()
             while True:
+                reload_seconds = self.config.config_reload_seconds
+                if reload_seconds and time.monotonic() - last_config_check >= reload_seconds:
+                    last_config_check = time.monotonic()
+                    self.reload_config()
+
                 schedule.run_pending()
                 time.sleep(1)
         except KeyboardInterrupt:
             self.logger.info("Scheduler stopped by user")
+        finally:
+            schedule.cancel_job(self.scheduled_job)
+            self.scheduled_job = None
+            if self.supervisor:
+                self.supervisor.stop_worker()
+                self.supervisor = None
+            self.scheduled_task = self.run_once
 
     def export_data(self, chains_data=None, format_type="csv"):
         if chains_data is None:
@@ -99,17 +148,18 @@ class DeFiLlamaScraper:
 
     def get_config_summary(self):
         return {
-            "scrape_interval": f"{self.config['scrape_interval_minutes']} minutes",
-            "output_file": self.config['output_filename'],
-            "log_file": self.config['log_filename'],
+            "scrape_interval": f"{self.config.scrape_interval_minutes} minutes",
+            "output_file": self.config.output_filename,
+            "log_file": self.config.log_filename,
             "historical_data":
-                "Enabled" if self.config['save_historical_data'] else "Disabled",
+                "Enabled" if self.config.save_historical_data else "Disabled",
             "include_zero_tvl":
-                "Enabled" if self.config['include_zero_tvl'] else "Disabled",
+                "Enabled" if self.config.include_zero_tvl else "Disabled",
+            "config_reload":
+                f"Every {self.config.config_reload_seconds} seconds"
+                if self.config.config_reload_seconds else "Disabled",
             "proxy_enabled":
-                "Enabled" if self.config.get("proxy", {})
-                .get("enabled", False) else "Disabled",
+                "Enabled" if self.config.proxy.enabled else "Disabled",
             "proxy_rotation":
-                "Enabled" if self.config.get("proxy", {})
-                .get("rotate_proxies", False) else "Disabled"
+                "Enabled" if self.config.proxy.rotate_proxies else "Disabled"
         }